@@ -13,14 +13,51 @@ Security concepts explained:
    - Frontend stores in localStorage and sends with each request
 """
 
+import bcrypt
 from passlib.context import CryptContext
-from jose import jwt, JWTError
-from datetime import datetime, timedelta
 from typing import Optional, Dict
+from cachetools import TTLCache
+import base64
+import hashlib
+import hmac
+import orjson
+import os
+import threading
+import time
 
 # Password hashing configuration
-# bcrypt is cryptographically secure and slow (prevents brute-force attacks)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt is cryptographically secure and slow (prevents brute-force attacks).
+# The cost is deliberate, but it is paid on the server for every login, so
+# it is tunable instead of hard-coded:
+#
+# - BCRYPT_ROUNDS (default 12): each +1 doubles hashing time. 12 is
+#   ~250-400ms per login on typical hardware; 10 is ~4x cheaper and still a
+#   reasonable floor for a low-stakes deployment.
+# - PASSWORD_SCHEME (default "bcrypt"): set to "argon2" to hash new
+#   passwords with argon2id instead. argon2-cffi's C implementation reaches
+#   equivalent security at a fraction of bcrypt-12's CPU time. Existing
+#   bcrypt hashes keep verifying either way because both schemes stay
+#   registered.
+#
+# The default bcrypt path calls the bcrypt C module directly instead of
+# going through passlib's CryptContext: passlib adds scheme dispatch, hash
+# identification, and backend checks on every call, which is pure-Python
+# overhead on top of an already expensive KDF. The CryptContext is kept
+# only for the argon2 scheme (PASSWORD_SCHEME=argon2) and for verifying
+# argon2 hashes created while that flag was on.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_SCHEME = os.getenv("PASSWORD_SCHEME", "bcrypt")
+
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default=PASSWORD_SCHEME,
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    # OWASP-recommended argon2id parameters (19 MiB memory, 2 iterations)
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 
 # JWT configuration
 # SECURITY WARNING: In production, use environment variable for SECRET_KEY
@@ -29,6 +66,43 @@ SECRET_KEY = "your-secret-key-change-in-production-use-env-variable-123456"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
+# HS256 signing state, prepared once at import:
+# - HMAC's expensive part is absorbing the key into the inner/outer padded
+#   blocks. A template HMAC object does that once; each signature then
+#   .copy()s the template and only hashes the signing input.
+# - The JOSE header never changes for this app, so its base64url form is a
+#   module-level constant.
+# Tokens produced this way are standard HS256 JWTs, interchangeable with
+# library-issued ones.
+_HMAC_TEMPLATE = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+
+def _b64url(data: bytes) -> str:
+    """base64url without padding, as required by the JWT spec"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode a base64url segment, restoring the stripped padding"""
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+
+# Token verification cache
+# Every authenticated request calls verify_token, which re-runs HMAC
+# verification and JSON parsing even when the same token is presented
+# thousands of times. Caching the decoded payload for a short window turns
+# the hot path into a dict lookup.
+#
+# Safety notes:
+# - Keys are SHA-256 digests of the token, so raw tokens never sit in memory
+# - The payload's own "exp" claim is still checked on every cache hit
+# - Failed verifications are never cached
+# - Short TTL bounds how long a revoked/rotated key would still be honored
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     """
@@ -52,6 +126,9 @@ def hash_password(password: str) -> str:
         
     Note: Same password produces different hash each time (due to random salt)
     """
+    if PASSWORD_SCHEME == "bcrypt":
+        # Direct C-module call; skips passlib's per-call dispatch
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
     return pwd_context.hash(password)
 
 
@@ -82,6 +159,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         Uses constant-time comparison to prevent timing attacks
         (attacker can't determine correct characters by timing)
     """
+    if hashed_password.startswith("$2"):
+        # bcrypt hash ($2a/$2b/$2y): verify with the C module directly
+        try:
+            return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        except ValueError:
+            # Malformed hash/password (e.g. >72 bytes on some backends)
+            return False
+    # Anything else (argon2) goes through passlib
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -118,14 +203,16 @@ def create_access_token(data: Dict) -> str:
         Authorization: Bearer <token>
     """
     to_encode = data.copy()
-    
-    # Add expiration time
-    expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
-    to_encode.update({"exp": expire})
-    
-    # Encode and sign token
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+
+    # Add expiration time (seconds since epoch, as the JWT spec expects)
+    to_encode["exp"] = int(time.time()) + ACCESS_TOKEN_EXPIRE_HOURS * 3600
+
+    # Build header.payload and sign it with a copy of the prepared HMAC
+    # template — the key setup cost was paid once at import
+    signing_input = f"{_JWT_HEADER_B64}.{_b64url(orjson.dumps(to_encode))}"
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(signing_input.encode())
+    return f"{signing_input}.{_b64url(mac.digest())}"
 
 
 def verify_token(token: str) -> Optional[Dict]:
@@ -159,14 +246,48 @@ def verify_token(token: str) -> Optional[Dict]:
     - Malformed token (not proper JWT format)
     - Wrong SECRET_KEY used to decode
     """
+    # Check cache first (keyed by token digest, not the raw token)
+    cache_key = hashlib.sha256(token.encode()).digest()
+    with _token_cache_lock:
+        payload = _token_cache.get(cache_key)
+    if payload is not None:
+        # Re-check expiration even on a hit: the cache TTL and the token's
+        # own lifetime are independent
+        if payload.get("exp", 0) > time.time():
+            return payload
+        return None
+
     try:
-        # Decode and verify token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
-        # Token is invalid, expired, or malformed
+        header_b64, payload_b64, signature_b64 = token.split('.')
+
+        # Recompute the signature from a copy of the prepared HMAC template
+        # and compare with compare_digest: constant-time (no early exit on
+        # the first differing byte), implemented in C, so there is no
+        # timing side channel and no speed penalty
+        mac = _HMAC_TEMPLATE.copy()
+        mac.update(f"{header_b64}.{payload_b64}".encode())
+        if not hmac.compare_digest(mac.digest(), _b64url_decode(signature_b64)):
+            return None
+
+        # Reject tokens signed with any other algorithm (e.g. alg=none)
+        header = orjson.loads(_b64url_decode(header_b64))
+        if header.get("alg") != ALGORITHM:
+            return None
+
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError:
+        # Malformed token (wrong segment count, bad base64, bad JSON) —
+        # never cache failures
         return None
 
+    # Enforce expiration
+    if payload.get("exp", 0) <= time.time():
+        return None
+
+    with _token_cache_lock:
+        _token_cache[cache_key] = payload
+    return payload
+
 
 # ============================================================================
 # Security Best Practices:
@@ -1,30 +1,40 @@
 """
-Database operations using JSON files.
+Database operations using SQLite.
 
-Why JSON files for this project?
-- No database setup required (beginner-friendly)
-- Easy to inspect and debug (just open the JSON file)
-- Portable (works on any OS)
-- Good for learning and small projects
+Why SQLite for this project?
+- No database server to install or run (single file in data/)
+- Indexed lookups: finding a user/quiz/result is O(log n) instead of
+  reading and scanning a whole JSON file on every request
+- Real transactions and crash safety (WAL journal)
+- Still easy to inspect: `sqlite3 data/app.db "SELECT * FROM users"`
 
-Limitations:
-- Not suitable for production or concurrent users
-- No transactions or ACID guarantees
-- Performance degrades with large datasets
-- File locking is basic
+This replaced the original JSON-file storage. The old data/*.json files
+are imported automatically the first time the server starts, so existing
+users, quizzes, and results carry over.
+
+Schema:
+- users(id PK, email UNIQUE, name, password_hash, role) — real columns
+  because we query by email (login) and id (JWT verification)
+- quizzes(id PK, data) — quiz stored as a JSON blob, always fetched whole
+- results(id PK, quiz_id, data) — JSON blob with an index on quiz_id for
+  the admin results listing
+
+Updates and deletes touch a single row, so the cost of changing one
+quiz or result is proportional to that record — the old storage rewrote
+an entire JSON file for every write.
 
 Migration path:
-- SQLite: Easy drop-in replacement, single file
-- PostgreSQL: Production-ready, handles concurrency
-- MongoDB: If you prefer document structure
+- PostgreSQL: Production-ready, handles many concurrent writers
+- Swap the connection handling, keep the same method signatures
 """
 
-import json
-import os
+import orjson
+import sqlite3
+from collections import defaultdict
 from typing import List, Optional
 from pathlib import Path
 import threading
-from models import User, Quiz, QuizResult
+from models import User, Quiz, Question, QuizResult, new_id, utc_datetime
 
 # Data directory configuration
 # Use path relative to this file so it works regardless of current working directory
@@ -32,119 +42,277 @@ BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
-# File paths
+# SQLite database file
+DB_FILE = DATA_DIR / "app.db"
+
+# Legacy JSON files (imported once, then left untouched)
 USERS_FILE = DATA_DIR / "users.json"
 QUIZZES_FILE = DATA_DIR / "quizzes.json"
 RESULTS_FILE = DATA_DIR / "results.json"
 
-# Thread locks for file access
-# Prevents race conditions when multiple requests access same file
-users_lock = threading.Lock()
-quizzes_lock = threading.Lock()
-results_lock = threading.Lock()
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id            TEXT PRIMARY KEY,
+    email         TEXT UNIQUE NOT NULL,
+    name          TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    role          TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quizzes (
+    id   TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id      TEXT PRIMARY KEY,
+    quiz_id TEXT NOT NULL,
+    data    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_quiz_id ON results(quiz_id);
+"""
+
+
+def _dump(record: dict) -> str:
+    """
+    Serialize a record to JSON text for storage.
+
+    orjson encodes/decodes several times faster than stdlib json (Rust
+    implementation, SIMD string handling). It produces bytes; we decode to
+    str so the data column stays TEXT and stays queryable with SQLite's
+    json_extract().
+    """
+    return orjson.dumps(record).decode()
+
+
+# Model builders for trusted records.
+#
+# Everything in the database was validated by pydantic when it came in
+# through the API, so re-validating on every read is wasted work —
+# model_construct skips field validation entirely and is several times
+# faster than the normal constructor. Nested models (quiz questions) have
+# to be constructed explicitly because model_construct does not recurse.
+# The validating constructors remain in use for request bodies.
+
+def _user_from_record(record: dict) -> User:
+    return User.model_construct(**record)
+
+
+def _quiz_from_record(record: dict) -> Quiz:
+    return Quiz.model_construct(
+        **{**record, 'questions': [Question.model_construct(**q) for q in record['questions']]}
+    )
+
+
+def _result_from_record(record: dict) -> QuizResult:
+    return QuizResult.model_construct(**record)
 
 
 class Database:
     """
-    Simple JSON file-based database.
-    
+    SQLite-backed database.
+
     Features:
-    - Thread-safe file operations with locks
-    - Atomic writes (temp file + rename)
-    - Automatic initialization with default data
+    - WAL journal mode: readers don't block the writer and vice versa
+    - One connection per thread (sqlite3 connections aren't thread-safe)
+    - In-memory indices over all records: reads are plain dict lookups,
+      writes go to both the indices and SQLite
+    - Automatic one-time import of the legacy JSON data files
     - Sample admin user and quiz for testing
+
+    Caching strategy: this workload is read-heavy (every authenticated
+    request resolves a user; quiz fetches dominate) while writes are rare
+    (signup, quiz editing, attempt updates). So all records are mirrored
+    in dicts loaded once at startup, and every write method updates the
+    dicts and persists to SQLite in the same call. Reads never touch disk.
     """
-    
+
     def __init__(self):
         """
-        Initialize database files and create default data
-        Called once when FastAPI starts
+        Initialize database schema and create default data.
+        Called once when FastAPI starts.
         """
-        self._init_file(USERS_FILE, [])
-        self._init_file(QUIZZES_FILE, [])
-        self._init_file(RESULTS_FILE, [])
-        self._create_default_admin()
-    
-    def _init_file(self, filepath: Path, default_data: list):
-        """Create file with default data if it doesn't exist"""
-        if not filepath.exists():
-            with open(filepath, 'w') as f:
-                json.dump(default_data, f, indent=2)
-    
-    def _read_json(self, filepath: Path, lock: threading.Lock) -> list:
-        """
-        Safely read JSON file with lock.
-        
-        Thread safety: Lock ensures only one thread reads at a time
-        Error handling: Returns empty list if file is corrupted
-        """
-        with lock:
-            try:
-                with open(filepath, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return []
-    
-    def _write_json(self, filepath: Path, data: list, lock: threading.Lock):
+        # Thread-local storage: each request-handling thread gets its own
+        # sqlite3 connection (connections must not be shared across threads)
+        self._local = threading.local()
+
+        # In-memory indices (record id/email -> raw record dict).
+        # Guarded by a single lock for mutations; lookups are atomic dict
+        # reads and don't need it.
+        self._cache_lock = threading.Lock()
+        self._users_by_id = {}
+        self._users_by_email = {}
+        # Memoized model objects. The getters used to run model_construct on
+        # every call even though the underlying record hadn't changed; since
+        # writes replace whole records, a per-id cache of the constructed
+        # User/Quiz stays valid until the next write to that id. Callers
+        # must treat returned models as read-only (they already do).
+        self._user_models = {}
+        self._quiz_models = {}
+        self._quizzes_by_id = {}
+        self._results_by_id = {}
+        self._results_by_quiz = defaultdict(list)
+        # (quiz_id, user_id) -> attempts, so start_quiz and my-result only
+        # ever look at this user's attempts instead of the whole quiz's
+        self._results_by_quiz_user = defaultdict(list)
+        # Denormalized attempt state for start_quiz: membership in
+        # _completed answers "has this user finished this quiz?" and
+        # _active_attempts maps to the one unfinished attempt (if any) —
+        # both O(1), no record loading at all on the common path
+        self._completed = set()
+        self._active_attempts = {}
+
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        # First-run setup (legacy import, default admin, sample quiz) is
+        # gated on a single indexed existence check so warm restarts skip
+        # straight to loading the indices
+        if conn.execute("SELECT 1 FROM users LIMIT 1").fetchone() is None:
+            self._import_legacy_json()
+            self._create_default_admin()
+        self._load_indices()
+
+    def _load_indices(self):
+        """Populate the in-memory indices from SQLite (startup only)"""
+        conn = self._conn()
+        with self._cache_lock:
+            self._users_by_id.clear()
+            self._users_by_email.clear()
+            self._user_models.clear()
+            self._quiz_models.clear()
+            self._quizzes_by_id.clear()
+            self._results_by_id.clear()
+            self._results_by_quiz.clear()
+            self._results_by_quiz_user.clear()
+            self._completed.clear()
+            self._active_attempts.clear()
+            for row in conn.execute("SELECT * FROM users"):
+                user = dict(row)
+                self._users_by_id[user['id']] = user
+                self._users_by_email[user['email']] = user
+            for row in conn.execute("SELECT data FROM quizzes"):
+                quiz = orjson.loads(row['data'])
+                self._quizzes_by_id[quiz['id']] = quiz
+            for row in conn.execute("SELECT data FROM results"):
+                self._index_result(orjson.loads(row['data']))
+
+    def _index_result(self, result: dict):
+        """Insert or replace one result dict in the in-memory indices"""
+        # Parse stored ISO timestamps into aware datetimes once, here, so
+        # every read served from the index (via model_construct, which skips
+        # validation) gets ready-to-use datetime objects. Records arriving
+        # from write paths already hold datetimes and pass through untouched.
+        for field in ('start_time', 'end_time'):
+            value = result.get(field)
+            if isinstance(value, str):
+                result[field] = utc_datetime(value)
+        # Split the legacy list-of-dicts answer shape into the parallel
+        # lists QuizResult now uses (model_construct bypasses the model's
+        # own converting validator)
+        answers = result.pop('answers', None)
+        if answers is not None:
+            result.setdefault('answer_qids', [a['question_id'] for a in answers])
+            result.setdefault('answer_choices', [a['chosen_index'] for a in answers])
+        previous = self._results_by_id.get(result['id'])
+        self._results_by_id[result['id']] = result
+        per_quiz = self._results_by_quiz[result['quiz_id']]
+        per_user = self._results_by_quiz_user[(result['quiz_id'], result['user_id'])]
+        if previous is not None:
+            for target in (per_quiz, per_user):
+                for i, entry in enumerate(target):
+                    if entry['id'] == result['id']:
+                        target[i] = result
+                        break
+        else:
+            per_quiz.append(result)
+            per_user.append(result)
+        # Keep the denormalized attempt state in step
+        key = (result['quiz_id'], result['user_id'])
+        if result['end_time'] is not None:
+            self._completed.add(key)
+            if self._active_attempts.get(key) == result['id']:
+                del self._active_attempts[key]
+        else:
+            self._active_attempts[key] = result['id']
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get (or lazily create) this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(DB_FILE)
+            conn.row_factory = sqlite3.Row
+            # WAL lets concurrent readers proceed during a write;
+            # synchronous=NORMAL is safe with WAL and much faster than FULL
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _import_legacy_json(self):
         """
-        Safely write JSON file with lock and atomic operation.
-        
-        Atomic write process:
-        1. Write to temporary file
-        2. Flush to disk
-        3. Rename temp file to target file (atomic on all OS)
-        
-        Why atomic?
-        - If process crashes during write, original file is intact
-        - No partial/corrupted data
-        - Other processes see old or new data, never partial
+        One-time import of the old JSON-file storage.
+        Only called on first run (empty users table), so it never
+        overwrites data that already lives in SQLite. The JSON files are
+        left in place for reference.
         """
-        with lock:
-            # Write to temporary file first
-            temp_file = filepath.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            # Atomic rename (works on Windows, Linux, Mac)
-            temp_file.replace(filepath)
-    
+        conn = self._conn()
+        with conn:
+            for user in self._load_legacy_file(USERS_FILE):
+                conn.execute(
+                    "INSERT OR IGNORE INTO users (id, email, name, password_hash, role) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (user['id'], user['email'], user['name'],
+                     user['password_hash'], user['role'])
+                )
+            for quiz in self._load_legacy_file(QUIZZES_FILE):
+                conn.execute(
+                    "INSERT OR IGNORE INTO quizzes (id, data) VALUES (?, ?)",
+                    (quiz['id'], _dump(quiz))
+                )
+            for result in self._load_legacy_file(RESULTS_FILE):
+                conn.execute(
+                    "INSERT OR IGNORE INTO results (id, quiz_id, data) VALUES (?, ?, ?)",
+                    (result['id'], result['quiz_id'], _dump(result))
+                )
+
+    def _load_legacy_file(self, filepath: Path) -> list:
+        """Read a legacy JSON data file; empty list if missing/corrupted"""
+        try:
+            return orjson.loads(filepath.read_bytes())
+        except (orjson.JSONDecodeError, FileNotFoundError):
+            return []
+
     def _create_default_admin(self):
         """
         Create default admin user if none exists.
         Also creates sample quiz for testing.
         """
         from auth import hash_password
-        import uuid
-        
-        users = self._read_json(USERS_FILE, users_lock)
-        
-        # Check if admin already exists
-        if not any(u['email'] == 'admin@example.com' for u in users):
-            admin = {
-                "id": "admin-001",
-                "name": "Admin User",
-                "email": "admin@example.com",
-                "password_hash": hash_password("Admin123!"),  # Default password
-                "role": "admin"
-            }
-            users.append(admin)
-            self._write_json(USERS_FILE, users, users_lock)
-            
+
+        row = self._conn().execute(
+            "SELECT 1 FROM users WHERE email = ?", ('admin@example.com',)
+        ).fetchone()
+        if not row:
+            admin = User(
+                id="admin-001",
+                name="Admin User",
+                email="admin@example.com",
+                password_hash=hash_password("Admin123!"),  # Default password
+                role="admin"
+            )
+            self.create_user(admin)
+
             # Create sample quiz
             self._create_sample_quiz()
-    
+
     def _create_sample_quiz(self):
         """Create a sample quiz for testing"""
-        import uuid
-        
-        sample_quiz = {
-            "id": str(uuid.uuid4()),
-            "title": "Python Basics Quiz",
-            "description": "Test your knowledge of Python fundamentals",
-            "time_limit_minutes": 10,
-            "questions": [
+        sample_quiz = Quiz(
+            id=new_id(),
+            title="Python Basics Quiz",
+            description="Test your knowledge of Python fundamentals",
+            time_limit_minutes=10,
+            questions=[
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": new_id(),
                     "text": "What is the output of print(type([]))?",
                     "options": [
                         "<class 'list'>",
@@ -155,7 +323,7 @@ class Database:
                     "correct_option_index": 0
                 },
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": new_id(),
                     "text": "Which keyword is used to define a function in Python?",
                     "options": [
                         "function",
@@ -166,7 +334,7 @@ class Database:
                     "correct_option_index": 1
                 },
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": new_id(),
                     "text": "What does the 'self' parameter represent in Python classes?",
                     "options": [
                         "The class itself",
@@ -177,7 +345,7 @@ class Database:
                     "correct_option_index": 1
                 },
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": new_id(),
                     "text": "Which data structure is mutable in Python?",
                     "options": [
                         "tuple",
@@ -188,7 +356,7 @@ class Database:
                     "correct_option_index": 2
                 },
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": new_id(),
                     "text": "What is the correct way to create a dictionary?",
                     "options": [
                         "dict = []",
@@ -199,131 +367,209 @@ class Database:
                     "correct_option_index": 2
                 }
             ]
-        }
-        
-        quizzes = self._read_json(QUIZZES_FILE, quizzes_lock)
-        quizzes.append(sample_quiz)
-        self._write_json(QUIZZES_FILE, quizzes, quizzes_lock)
-    
+        )
+        self.create_quiz(sample_quiz)
+
     # ========================================================================
     # USER OPERATIONS
     # ========================================================================
-    
+
     def create_user(self, user: User):
         """Add new user to database"""
-        users = self._read_json(USERS_FILE, users_lock)
-        users.append(user.dict())
-        self._write_json(USERS_FILE, users, users_lock)
-    
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO users (id, email, name, password_hash, role) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (user.id, user.email, user.name, user.password_hash, user.role.value)
+            )
+        user_data = user.model_dump()
+        with self._cache_lock:
+            self._users_by_id[user.id] = user_data
+            self._users_by_email[user.email] = user_data
+            self._user_models.pop(user.id, None)
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Find user by email (for login)"""
-        users = self._read_json(USERS_FILE, users_lock)
-        user_data = next((u for u in users if u['email'] == email), None)
-        return User(**user_data) if user_data else None
-    
+        user_data = self._users_by_email.get(email)
+        return self._user_model(user_data) if user_data else None
+
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Find user by ID (for JWT verification)"""
-        users = self._read_json(USERS_FILE, users_lock)
-        user_data = next((u for u in users if u['id'] == user_id), None)
-        return User(**user_data) if user_data else None
-    
+        user_data = self._users_by_id.get(user_id)
+        return self._user_model(user_data) if user_data else None
+
+    def _user_model(self, user_data: dict) -> User:
+        """Construct-once User for a record (see __init__ model caches)"""
+        user = self._user_models.get(user_data['id'])
+        if user is None:
+            user = _user_from_record(user_data)
+            self._user_models[user_data['id']] = user
+        return user
+
+    def get_users_by_ids(self, user_ids) -> dict:
+        """
+        Batch lookup: user_id -> User for every id that exists.
+        For endpoints that resolve many users (the admin results listing),
+        one call here replaces a get_user_by_id per row. Unknown ids are
+        simply absent from the returned dict.
+        """
+        users = {}
+        for user_id in user_ids:
+            user_data = self._users_by_id.get(user_id)
+            if user_data:
+                users[user_id] = self._user_model(user_data)
+        return users
+
     # ========================================================================
     # QUIZ OPERATIONS
     # ========================================================================
-    
+
     def create_quiz(self, quiz: Quiz):
         """Add new quiz to database"""
-        quizzes = self._read_json(QUIZZES_FILE, quizzes_lock)
-        quizzes.append(quiz.dict())
-        self._write_json(QUIZZES_FILE, quizzes, quizzes_lock)
-    
+        quiz_data = quiz.model_dump()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO quizzes (id, data) VALUES (?, ?)",
+                (quiz.id, _dump(quiz_data))
+            )
+        with self._cache_lock:
+            self._quizzes_by_id[quiz.id] = quiz_data
+            self._quiz_models.pop(quiz.id, None)
+
     def get_all_quizzes(self) -> List[Quiz]:
         """Get all quizzes (for listing)"""
-        quizzes = self._read_json(QUIZZES_FILE, quizzes_lock)
-        return [Quiz(**q) for q in quizzes]
-    
+        return [_quiz_from_record(q) for q in list(self._quizzes_by_id.values())]
+
     def get_quiz_by_id(self, quiz_id: str) -> Optional[Quiz]:
         """Find quiz by ID"""
-        quizzes = self._read_json(QUIZZES_FILE, quizzes_lock)
-        quiz_data = next((q for q in quizzes if q['id'] == quiz_id), None)
-        return Quiz(**quiz_data) if quiz_data else None
-    
+        quiz = self._quiz_models.get(quiz_id)
+        if quiz is None:
+            quiz_data = self._quizzes_by_id.get(quiz_id)
+            if quiz_data is None:
+                return None
+            quiz = _quiz_from_record(quiz_data)
+            self._quiz_models[quiz_id] = quiz
+        return quiz
+
     def update_quiz(self, quiz: Quiz):
         """
         Update existing quiz.
         Replaces entire quiz object (no partial updates)
         """
-        quizzes = self._read_json(QUIZZES_FILE, quizzes_lock)
-        updated_quizzes = [
-            quiz.dict() if q['id'] == quiz.id else q
-            for q in quizzes
-        ]
-        self._write_json(QUIZZES_FILE, updated_quizzes, quizzes_lock)
-    
+        quiz_data = quiz.model_dump()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE quizzes SET data = ? WHERE id = ?",
+                (_dump(quiz_data), quiz.id)
+            )
+        with self._cache_lock:
+            self._quizzes_by_id[quiz.id] = quiz_data
+            self._quiz_models.pop(quiz.id, None)
+
     def delete_quiz(self, quiz_id: str):
         """Delete quiz by ID"""
-        quizzes = self._read_json(QUIZZES_FILE, quizzes_lock)
-        filtered_quizzes = [q for q in quizzes if q['id'] != quiz_id]
-        self._write_json(QUIZZES_FILE, filtered_quizzes, quizzes_lock)
-    
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM quizzes WHERE id = ?", (quiz_id,))
+        with self._cache_lock:
+            self._quizzes_by_id.pop(quiz_id, None)
+            self._quiz_models.pop(quiz_id, None)
+
     # ========================================================================
     # RESULT OPERATIONS
     # ========================================================================
-    
+
     def create_result(self, result: QuizResult):
         """
         Add new result to database.
         Called when student starts a quiz (with empty answers)
         """
-        results = self._read_json(RESULTS_FILE, results_lock)
-        results.append(result.dict())
-        self._write_json(RESULTS_FILE, results, results_lock)
-    
+        result_data = result.model_dump()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO results (id, quiz_id, data) VALUES (?, ?, ?)",
+                (result.id, result.quiz_id, _dump(result_data))
+            )
+        with self._cache_lock:
+            self._index_result(result_data)
+
     def get_result_by_id(self, result_id: str) -> Optional[QuizResult]:
         """Find result by ID (attempt_id)"""
-        results = self._read_json(RESULTS_FILE, results_lock)
-        result_data = next((r for r in results if r['id'] == result_id), None)
-        return QuizResult(**result_data) if result_data else None
-    
+        result_data = self._results_by_id.get(result_id)
+        return _result_from_record(result_data) if result_data else None
+
     def update_result(self, result: QuizResult):
         """
         Update existing result.
         Called when student submits quiz (adds answers and score)
         """
-        results = self._read_json(RESULTS_FILE, results_lock)
-        updated_results = [
-            result.dict() if r['id'] == result.id else r
-            for r in results
-        ]
-        self._write_json(RESULTS_FILE, updated_results, results_lock)
-    
+        result_data = self.apply_result_update(result)
+        self.persist_result(result_data)
+
+    def apply_result_update(self, result: QuizResult) -> dict:
+        """
+        Update only the in-memory indices; returns the record dict.
+        Reads see the new state immediately. The caller is responsible for
+        handing the returned record to persist_result — this split lets the
+        submit path answer the client before the disk write happens.
+        """
+        result_data = result.model_dump()
+        with self._cache_lock:
+            self._index_result(result_data)
+        return result_data
+
+    def persist_result(self, result_data: dict):
+        """Write one result record to SQLite (safe to run off the request path)"""
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE results SET data = ? WHERE id = ?",
+                (_dump(result_data), result_data['id'])
+            )
+
     def get_results_by_quiz(self, quiz_id: str) -> List[QuizResult]:
         """Get all results for a specific quiz (for admin view)"""
-        results = self._read_json(RESULTS_FILE, results_lock)
-        return [QuizResult(**r) for r in results if r['quiz_id'] == quiz_id]
+        per_quiz = self._results_by_quiz.get(quiz_id, [])
+        return [_result_from_record(r) for r in list(per_quiz)]
+
+    def get_results_by_quiz_user(self, quiz_id: str, user_id: str) -> List[QuizResult]:
+        """
+        Get one user's attempts on a quiz (for start_quiz / my-result).
+        Indexed lookup: cost scales with this user's attempts (usually one),
+        not with everyone who ever took the quiz.
+        """
+        per_user = self._results_by_quiz_user.get((quiz_id, user_id), [])
+        return [_result_from_record(r) for r in list(per_user)]
+
+    def has_completed(self, quiz_id: str, user_id: str) -> bool:
+        """O(1): has this user a finished attempt on this quiz?"""
+        return (quiz_id, user_id) in self._completed
+
+    def get_active_attempt(self, quiz_id: str, user_id: str) -> Optional[QuizResult]:
+        """O(1): this user's unfinished attempt on this quiz, if any"""
+        attempt_id = self._active_attempts.get((quiz_id, user_id))
+        if attempt_id is None:
+            return None
+        record = self._results_by_id.get(attempt_id)
+        return _result_from_record(record) if record else None
 
 
 # ============================================================================
-# Migration Guide to Real Database:
+# Inspecting the database:
 #
-# SQLite (easiest):
-# 1. Install: pip install sqlalchemy aiosqlite
-# 2. Define models with SQLAlchemy ORM
-# 3. Replace file operations with database queries
-# 4. Single file database (data/quiz_app.db)
+#   sqlite3 backend/data/app.db
+#   .tables
+#   SELECT id, email, role FROM users;
+#   SELECT json_extract(data, '$.title') FROM quizzes;
 #
-# PostgreSQL (production):
+# Migration Guide to PostgreSQL (production):
 # 1. Install: pip install sqlalchemy asyncpg
 # 2. Set up PostgreSQL server
 # 3. Create database and tables
 # 4. Update connection string in environment variable
 # 5. Use connection pooling
-#
-# MongoDB (document-oriented):
-# 1. Install: pip install motor
-# 2. Set up MongoDB server
-# 3. Replace operations with MongoDB queries
-# 4. Schema is flexible (similar to JSON)
-#
-# All options work well with FastAPI's async capabilities!
-# ============================================================================
\ No newline at end of file
+# ============================================================================
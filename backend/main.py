@@ -3,23 +3,42 @@
 # Main FastAPI application - Entry point for backend server
 # ============================================================================
 
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import BackgroundTasks, FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import List, Optional
 from datetime import datetime, timedelta, timezone
-import uuid
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+from cachetools import TTLCache
 
 from models import (
     UserSignup, UserLogin, User, TokenResponse,
     QuizCreate, Quiz, QuizDetail, QuestionResponse,
-    QuizStart, QuizSubmit, QuizResult, ResultDetail
+    QuizStart, QuizSubmit, QuizResult, ResultDetail, new_id, iso_z
 )
 from auth import hash_password, verify_password, create_access_token, verify_token
 from database import Database
 
+# Logging setup. Debug messages on the request path use lazy %-formatting
+# through logger.debug so they cost a single level check (no string build,
+# no stdout lock) unless debug logging is actually enabled.
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI app
-app = FastAPI(title="Quiz Application API", version="1.0.0")
+# ORJSONResponse serializes every JSON response through orjson (Rust) instead
+# of stdlib json — a sizeable saving on quiz lists and result breakdowns
+app = FastAPI(
+    title="Quiz Application API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Configure CORS - allows frontend to communicate with backend
 app.add_middleware(
@@ -42,9 +61,87 @@ app.add_middleware(
 # Initialize database
 db = Database()
 
+
+@app.on_event("startup")
+async def configure_executor():
+    """
+    Size the default thread pool that asyncio.to_thread uses.
+
+    Every bcrypt hash/verify and SQLite write runs there. bcrypt releases
+    the GIL and a hash takes hundreds of ms, so a bounded pool sets a clear
+    ceiling on concurrent hashing work (beyond it, logins queue instead of
+    oversubscribing CPU) while still being far larger than the write
+    traffic needs. The stdlib default scales with CPU count and is tuned
+    for blocking I/O, not CPU-bound KDF calls.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=16, thread_name_prefix="worker"))
+
 # Security scheme for JWT authentication
 security = HTTPBearer()
 
+# user_id -> User cache for get_current_user, which runs on every
+# authenticated request. The short TTL bounds staleness; entries are also
+# dropped explicitly when a user record changes (signup).
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+_user_cache_lock = threading.Lock()
+
+# Response caches for the result endpoints.
+# - _quiz_results_cache: the admin listing rebuilds a ResultDetail per
+#   completed attempt on every call; dashboards poll it. Short TTL, keyed by
+#   quiz_id, invalidated on every submission for that quiz.
+# - _result_detail_cache: a single attempt's breakdown is immutable once
+#   end_time is set (re-attempts are blocked), so it can live much longer.
+#   Keyed by attempt_id, or by (quiz_id, user_id) for the my-result view.
+_quiz_results_cache = TTLCache(maxsize=256, ttl=30)
+_result_detail_cache = TTLCache(maxsize=2048, ttl=3600)
+_results_cache_lock = threading.Lock()
+
+# Per-quiz scorer closures. Everything submit_quiz needs that depends only
+# on the quiz (answer key, question texts) is captured once in a closure
+# the first time that quiz is submitted, so each submission pays two fast
+# cell-variable lookups instead of rebuilding the dicts. Quizzes change
+# rarely; edits and deletions drop the entry.
+_scorers = {}
+_scorers_lock = threading.Lock()
+
+
+def _make_scorer(quiz: Quiz):
+    """Specialize the scoring function for one quiz"""
+    answer_key = {q.id: q.correct_option_index for q in quiz.questions}
+    texts = {q.id: q.text for q in quiz.questions}
+
+    def score(answers):
+        """answers -> (correct_count, question_results); unknown ids skipped"""
+        correct_count = sum(
+            1 for a in answers
+            if answer_key.get(a.question_id) == a.chosen_index
+        )
+        question_results = [
+            {
+                "question_id": a.question_id,
+                "question_text": texts[a.question_id],
+                "chosen_index": a.chosen_index,
+                "correct_index": answer_key[a.question_id],
+                "is_correct": a.chosen_index == answer_key[a.question_id]
+            }
+            for a in answers
+            if a.question_id in answer_key
+        ]
+        return correct_count, question_results
+
+    return score
+
+
+def _get_scorer(quiz: Quiz):
+    """Fetch (or lazily build) the scorer closure for a quiz"""
+    scorer = _scorers.get(quiz.id)
+    if scorer is None:
+        scorer = _make_scorer(quiz)
+        with _scorers_lock:
+            _scorers[quiz.id] = scorer
+    return scorer
+
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
     """Extract and validate JWT token, return current user"""
@@ -55,8 +152,15 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token"
         )
-    
-    user = db.get_user_by_id(payload["user_id"])
+
+    user_id = payload["user_id"]
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    if user is None:
+        user = db.get_user_by_id(user_id)
+        if user is not None:
+            with _user_cache_lock:
+                _user_cache[user_id] = user
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -88,35 +192,38 @@ async def signup(user_data: UserSignup):
     - Hashes password with bcrypt
     - Returns JWT token for immediate login
     """
-    print(f"Signup attempt for email: {user_data.email}")  # Debug log
-    try:
-        if db.get_user_by_email(user_data.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        user = User(
-            id=str(uuid.uuid4()),
-            name=user_data.name,
-            email=user_data.email,
-            password_hash=hash_password(user_data.password),
-            role=user_data.role
-        )
-        
-        print(f"Creating new user with ID: {user.id}")  # Debug log
-        db.create_user(user)
-        token = create_access_token({"user_id": user.id, "role": user.role})
-        print("User created successfully")  # Debug log
-        
-        return TokenResponse(access_token=token, user=user)
-    except Exception as e:
-        print(f"Error during signup: {str(e)}")  # Debug log
+    # No blanket try/except here: it used to catch the HTTPException below
+    # and re-wrap "Email already registered" as a 500, and FastAPI already
+    # turns unhandled exceptions into logged 500 responses on its own
+    if db.get_user_by_email(user_data.email):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Signup failed: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
         )
 
+    # Hash in a worker thread: bcrypt takes hundreds of ms and releases
+    # the GIL, so this keeps the event loop free for other requests
+    password_hash = await asyncio.to_thread(hash_password, user_data.password)
+    user = User(
+        id=new_id(),
+        name=user_data.name,
+        email=user_data.email,
+        password_hash=password_hash,
+        role=user_data.role
+    )
+
+    # SQLite writes hit the disk (WAL fsync); run them in a worker thread so
+    # the event loop stays free, same as the bcrypt calls above
+    await asyncio.to_thread(db.create_user, user)
+    # Drop any stale cache entry for this id (paranoia: ids are fresh
+    # random values, but invalidating on user mutation keeps the pattern
+    # honest)
+    with _user_cache_lock:
+        _user_cache.pop(user.id, None)
+    token = create_access_token({"user_id": user.id, "role": user.role})
+
+    return TokenResponse(access_token=token, user=user)
+
 
 @app.post("/api/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
@@ -126,8 +233,12 @@ async def login(credentials: UserLogin):
     - Returns token with user info
     """
     user = db.get_user_by_email(credentials.email)
-    
-    if not user or not verify_password(credentials.password, user.password_hash):
+
+    # Run the slow bcrypt verification off the event loop so one login
+    # doesn't stall every other in-flight request on this worker
+    if not user or not await asyncio.to_thread(
+        verify_password, credentials.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -162,28 +273,20 @@ async def get_quiz(quiz_id: str, current_user: User = Depends(get_current_user))
             detail="Quiz not found"
         )
     
-    # Hide correct answers for students
-    if current_user.role == "student":
-        questions = [
-            QuestionResponse(
-                id=q.id,
-                text=q.text,
-                options=q.options,
-                correct_option_index=None
-            )
-            for q in quiz.questions
-        ]
-    else:
-        questions = [
-            QuestionResponse(
-                id=q.id,
-                text=q.text,
-                options=q.options,
-                correct_option_index=q.correct_option_index
-            )
-            for q in quiz.questions
-        ]
-    
+    # Hide correct answers for students. One comprehension with the role
+    # check hoisted out of the loop; model_construct skips validation since
+    # the fields come straight from an already-validated quiz.
+    hide = current_user.role == "student"
+    questions = [
+        QuestionResponse.model_construct(
+            id=q.id,
+            text=q.text,
+            options=q.options,
+            correct_option_index=None if hide else q.correct_option_index
+        )
+        for q in quiz.questions
+    ]
+
     return QuizDetail(
         id=quiz.id,
         title=quiz.title,
@@ -197,14 +300,14 @@ async def get_quiz(quiz_id: str, current_user: User = Depends(get_current_user))
 async def create_quiz(quiz_data: QuizCreate, admin: User = Depends(require_admin)):
     """Create new quiz (admin only)"""
     quiz = Quiz(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         title=quiz_data.title,
         description=quiz_data.description,
         time_limit_minutes=quiz_data.time_limit_minutes,
         questions=quiz_data.questions
     )
     
-    db.create_quiz(quiz)
+    await asyncio.to_thread(db.create_quiz, quiz)
     return quiz
 
 
@@ -231,7 +334,14 @@ async def update_quiz(
         questions=quiz_data.questions
     )
     
-    db.update_quiz(updated_quiz)
+    await asyncio.to_thread(db.update_quiz, updated_quiz)
+    # Question text / correct answers may have changed: drop every cached
+    # result rendering (cheap — the caches rebuild lazily)
+    with _results_cache_lock:
+        _quiz_results_cache.pop(quiz_id, None)
+        _result_detail_cache.clear()
+    with _scorers_lock:
+        _scorers.pop(quiz_id, None)
     return updated_quiz
 
 
@@ -244,7 +354,12 @@ async def delete_quiz(quiz_id: str, admin: User = Depends(require_admin)):
             detail="Quiz not found"
         )
     
-    db.delete_quiz(quiz_id)
+    await asyncio.to_thread(db.delete_quiz, quiz_id)
+    with _results_cache_lock:
+        _quiz_results_cache.pop(quiz_id, None)
+        _result_detail_cache.clear()
+    with _scorers_lock:
+        _scorers.pop(quiz_id, None)
 
 
 # ============================================================================
@@ -272,81 +387,60 @@ async def start_quiz(quiz_id: str, current_user: User = Depends(get_current_user
             detail="Quiz not found"
         )
     
-    # Check for any prior attempts by this user
-    existing_attempts = db.get_results_by_quiz(quiz_id)
-    # If a completed attempt exists, block further attempts
-    for attempt in existing_attempts:
-        if attempt.user_id == current_user.id and attempt.end_time is not None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You have already completed this quiz. Multiple attempts are not allowed."
-            )
+    # Both prior-attempt questions — "already finished?" and "open attempt
+    # to resume?" — are answered from denormalized O(1) state maintained at
+    # result write time; no attempt records are scanned here
+    if db.has_completed(quiz_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already completed this quiz. Multiple attempts are not allowed."
+        )
 
-    # Check for existing unfinished attempts by this user
-    for attempt in existing_attempts:
-        if attempt.user_id == current_user.id and attempt.end_time is None:
-            # Parse stored start time (support both naive ISO and trailing 'Z')
-            raw_start = attempt.start_time
-            try:
-                if raw_start.endswith('Z'):
-                    stored_start = datetime.fromisoformat(raw_start.replace('Z', '+00:00'))
-                else:
-                    stored_start = datetime.fromisoformat(raw_start)
-                # Normalize to aware UTC
-                if stored_start.tzinfo is None:
-                    stored_start = stored_start.replace(tzinfo=timezone.utc)
-            except ValueError:
-                # If parsing fails, treat as expired and continue to create a new attempt
-                stored_start = None
-
-            if stored_start:
-                now_utc = datetime.now(timezone.utc)
-                elapsed_minutes = (now_utc - stored_start).total_seconds() / 60
-                # If attempt is still within allowed time window (including 30s grace), return it
-                if elapsed_minutes <= quiz.time_limit_minutes + 0.5:
-                    # Debug log: returning existing unfinished attempt
-                    print(f"[DEBUG] Returning existing attempt {attempt.id} for user {current_user.id}. elapsed_minutes={elapsed_minutes:.2f}")
-                    # Always return ISO string with 'Z' suffix for UTC consistency
-                    start_time_iso_z = stored_start.isoformat()
-                    if not start_time_iso_z.endswith('Z') and '+' not in start_time_iso_z:
-                        start_time_iso_z = start_time_iso_z + 'Z'
-                    return QuizStart(
-                        attempt_id=attempt.id,
-                        start_time=start_time_iso_z,
-                        time_limit_minutes=quiz.time_limit_minutes
-                    )
-                else:
-                    # Expired attempt: mark it as ended to avoid resuming an expired session
-                    end_dt = stored_start + timedelta(minutes=quiz.time_limit_minutes)
-                    # Ensure ISO Z suffix
-                    attempt.end_time = end_dt.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
-                    db.update_result(attempt)
-                    print(f"[DEBUG] Marked expired attempt {attempt.id} as ended (user {current_user.id}). elapsed_minutes={elapsed_minutes:.2f}")
-                    # continue to create a fresh attempt
+    attempt = db.get_active_attempt(quiz_id, current_user.id)
+    if attempt is not None:
+        # Timestamps are already aware UTC datetimes (parsed once when the
+        # record entered the system), so this is pure arithmetic
+        now_utc = datetime.now(timezone.utc)
+        elapsed_minutes = (now_utc - attempt.start_time).total_seconds() / 60
+        # If attempt is still within allowed time window (including 30s grace), return it
+        if elapsed_minutes <= quiz.time_limit_minutes + 0.5:
+            logger.debug(
+                "Returning existing attempt %s for user %s. elapsed_minutes=%.2f",
+                attempt.id, current_user.id, elapsed_minutes
+            )
+            return QuizStart(
+                attempt_id=attempt.id,
+                start_time=iso_z(attempt.start_time),
+                time_limit_minutes=quiz.time_limit_minutes
+            )
+        else:
+            # Expired attempt: mark it as ended to avoid resuming an expired session
+            attempt.end_time = attempt.start_time + timedelta(minutes=quiz.time_limit_minutes)
+            await asyncio.to_thread(db.update_result, attempt)
+            logger.debug(
+                "Marked expired attempt %s as ended (user %s). elapsed_minutes=%.2f",
+                attempt.id, current_user.id, elapsed_minutes
+            )
+            # continue to create a fresh attempt
 
     # Create new attempt only if no unfinished attempt exists
-    attempt_id = str(uuid.uuid4())
+    attempt_id = new_id()
     start_time = datetime.now(timezone.utc)
-    
-    # Store timestamps as UTC ISO strings with explicit 'Z' suffix so clients
-    # can reliably parse them as UTC. We append 'Z' to the naive UTC isoformat.
-    start_iso_z = start_time.isoformat().replace('+00:00', 'Z')
 
     result = QuizResult(
         id=attempt_id,
         quiz_id=quiz_id,
         user_id=current_user.id,
-        start_time=start_iso_z,
+        start_time=start_time,
         end_time=None,
-        answers=[],
         score=0
     )
-    
-    db.create_result(result)
-    
+
+    await asyncio.to_thread(db.create_result, result)
+
     return QuizStart(
         attempt_id=attempt_id,
-        start_time=start_iso_z,
+        start_time=iso_z(start_time),
         time_limit_minutes=quiz.time_limit_minutes
     )
 
@@ -355,6 +449,7 @@ async def start_quiz(quiz_id: str, current_user: User = Depends(get_current_user
 async def submit_quiz(
     quiz_id: str,
     submission: QuizSubmit,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -384,72 +479,98 @@ async def submit_quiz(
             detail="Not authorized to submit this attempt"
         )
     
-    # Validate time window
-    # Accept either a plain ISO string (no timezone) or a trailing 'Z'. If the
-    # stored time ends with 'Z' convert it to an explicit +00:00 offset so
-    # datetime.fromisoformat can parse it across Python versions.
-    try:
-        raw_start = result.start_time
-        if raw_start.endswith('Z'):
-            # replace trailing Z with +00:00 for ISO offset parsing
-            start_time = datetime.fromisoformat(raw_start.replace('Z', '+00:00'))
-        else:
-            start_time = datetime.fromisoformat(raw_start)
-        # Normalize to aware UTC for arithmetic
-        if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=timezone.utc)
-        end_time = datetime.now(timezone.utc)
-        elapsed_minutes = (end_time - start_time).total_seconds() / 60
-        
-        if elapsed_minutes > quiz.time_limit_minutes + 0.5:  # 30 second grace
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Time limit exceeded. Quiz must be submitted within {quiz.time_limit_minutes} minutes. Elapsed time: {round(elapsed_minutes, 1)} minutes"
-            )
-    except ValueError as e:
-        # Handle timestamp parsing errors
+    # Validate time window. start_time is already an aware UTC datetime,
+    # parsed once when the attempt record was created/loaded.
+    end_time = datetime.now(timezone.utc)
+    elapsed_minutes = (end_time - result.start_time).total_seconds() / 60
+
+    if elapsed_minutes > quiz.time_limit_minutes + 0.5:  # 30 second grace
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid timestamp format: {str(e)}"
+            detail=f"Time limit exceeded. Quiz must be submitted within {quiz.time_limit_minutes} minutes. Elapsed time: {round(elapsed_minutes, 1)} minutes"
         )
-    
-    # Calculate score and build question results
-    correct_count = 0
-    question_results = []
-    
-    for answer in submission.answers:
-        question = next((q for q in quiz.questions if q.id == answer.question_id), None)
-        if question:
-            is_correct = answer.chosen_index == question.correct_option_index
-            if is_correct:
-                correct_count += 1
-            
-            question_results.append({
-                "question_id": answer.question_id,
-                "question_text": question.text,
-                "chosen_index": answer.chosen_index,
-                "correct_index": question.correct_option_index,
-                "is_correct": is_correct
-            })
-    
+
+    # Score through the quiz's specialized closure (see _make_scorer):
+    # the answer key and question texts were captured when the closure was
+    # built, so nothing quiz-shaped is reconstructed per submission
+    correct_count, question_results = _get_scorer(quiz)(submission.answers)
+
     score = (correct_count / len(quiz.questions)) * 100 if quiz.questions else 0
     
     # Update result in database
-    # Store end_time also with explicit 'Z' suffix
-    result.end_time = end_time.isoformat().replace('+00:00', 'Z')
-    result.answers = [a.dict() for a in submission.answers]
+    result.end_time = end_time
+    # Struct-of-arrays storage: two flat lists instead of a dict per answer
+    result.answer_qids = [a.question_id for a in submission.answers]
+    result.answer_choices = [a.chosen_index for a in submission.answers]
     result.score = round(score, 2)
-    
-    db.update_result(result)
-    
+    # Store the breakdown with the attempt — the GET endpoints serve it
+    # as-is instead of re-deriving it on every call
+    result.correct_answers = correct_count
+    result.question_results = question_results
+
+    # Indices are updated synchronously — any read after this line sees the
+    # completed attempt — while the SQLite write runs as a background task
+    # after the response is sent, taking the fsync off the submit latency
+    record = db.apply_result_update(result)
+    background_tasks.add_task(db.persist_result, record)
+
+    # A new completed attempt changes the admin listing and this user's
+    # my-result view; drop their cached renderings
+    with _results_cache_lock:
+        _quiz_results_cache.pop(quiz_id, None)
+        _result_detail_cache.pop((quiz_id, current_user.id), None)
+
     return ResultDetail(
         id=result.id,
         quiz_id=quiz_id,
         quiz_title=quiz.title,
         user_id=current_user.id,
         user_name=current_user.name,
-        start_time=result.start_time,
-        end_time=result.end_time,
+        start_time=iso_z(result.start_time),
+        end_time=iso_z(result.end_time),
+        score=result.score,
+        total_questions=len(quiz.questions),
+        correct_answers=correct_count,
+        question_results=question_results
+    )
+
+
+def _build_result_detail(result: QuizResult, quiz: Quiz, user: Optional[User],
+                         questions_by_id: Optional[dict] = None) -> ResultDetail:
+    """
+    Render one attempt as a ResultDetail.
+    Uses the breakdown persisted at submit time; rebuilds it only for
+    legacy attempts stored before it existed. questions_by_id is only
+    needed for that rebuild — callers rendering many attempts pass one
+    prebuilt dict, single-attempt callers let it be built on demand.
+    """
+    question_results = result.question_results
+    if question_results:
+        correct_count = result.correct_answers
+    else:
+        if questions_by_id is None:
+            questions_by_id = {q.id: q for q in quiz.questions}
+        question_results = []
+        for qid, chosen in zip(result.answer_qids, result.answer_choices):
+            question = questions_by_id.get(qid)
+            if question:
+                question_results.append({
+                    "question_id": qid,
+                    "question_text": question.text,
+                    "chosen_index": chosen,
+                    "correct_index": question.correct_option_index,
+                    "is_correct": chosen == question.correct_option_index
+                })
+        correct_count = sum(1 for qr in question_results if qr["is_correct"])
+
+    return ResultDetail(
+        id=result.id,
+        quiz_id=result.quiz_id,
+        quiz_title=quiz.title,
+        user_id=result.user_id,
+        user_name=user.name if user else "Unknown",
+        start_time=iso_z(result.start_time),
+        end_time=iso_z(result.end_time) if result.end_time else None,
         score=result.score,
         total_questions=len(quiz.questions),
         correct_answers=correct_count,
@@ -458,55 +579,64 @@ async def submit_quiz(
 
 
 @app.get("/api/quizzes/{quiz_id}/results", response_model=List[ResultDetail])
-async def get_quiz_results(quiz_id: str, admin: User = Depends(require_admin)):
+async def get_quiz_results(quiz_id: str, format: Optional[str] = None,
+                           admin: User = Depends(require_admin)):
     """
     Get all student results for a quiz (admin only)
     - Returns completed attempts with detailed breakdown
+    - ?format=ndjson streams one result per line instead of building the
+      whole listing in memory (for large exports)
     """
     quiz = db.get_quiz_by_id(quiz_id)
-    
+
     if not quiz:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Quiz not found"
         )
-    
+
+    # One batched user lookup for the whole listing instead of a
+    # get_user_by_id call per attempt row; the question dict is built once
+    # because the breakdown fallback runs per attempt
+    if format == "ndjson":
+        # Streaming path: each row is rendered, serialized, and released
+        # before the next one is touched — O(1) steady-state memory, and
+        # the first byte leaves before the last row is built. Opt-in
+        # because the in-tree frontend parses the default JSON array.
+        results = db.get_results_by_quiz(quiz_id)
+        users_by_id = db.get_users_by_ids({r.user_id for r in results if r.end_time})
+        questions_by_id = {q.id: q for q in quiz.questions}
+
+        async def stream():
+            for result in results:
+                if not result.end_time:  # Skip incomplete attempts
+                    continue
+                detail = _build_result_detail(
+                    result, quiz, users_by_id.get(result.user_id), questions_by_id
+                )
+                # orjson writes bytes directly — no str round-trip before
+                # the transport encodes the chunk
+                yield orjson.dumps(detail.model_dump()) + b"\n"
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    with _results_cache_lock:
+        cached = _quiz_results_cache.get(quiz_id)
+    if cached is not None:
+        return cached
+
     results = db.get_results_by_quiz(quiz_id)
-    detailed_results = []
-    
-    for result in results:
-        if not result.end_time:  # Skip incomplete attempts
-            continue
-        
-        user = db.get_user_by_id(result.user_id)
-        
-        # Reconstruct question results
-        question_results = []
-        for answer in result.answers:
-            question = next((q for q in quiz.questions if q.id == answer["question_id"]), None)
-            if question:
-                question_results.append({
-                    "question_id": answer["question_id"],
-                    "question_text": question.text,
-                    "chosen_index": answer["chosen_index"],
-                    "correct_index": question.correct_option_index,
-                    "is_correct": answer["chosen_index"] == question.correct_option_index
-                })
-        
-        detailed_results.append(ResultDetail(
-            id=result.id,
-            quiz_id=quiz_id,
-            quiz_title=quiz.title,
-            user_id=result.user_id,
-            user_name=user.name if user else "Unknown",
-            start_time=result.start_time,
-            end_time=result.end_time,
-            score=result.score,
-            total_questions=len(quiz.questions),
-            correct_answers=sum(1 for qr in question_results if qr["is_correct"]),
-            question_results=question_results
-        ))
-    
+    users_by_id = db.get_users_by_ids({r.user_id for r in results if r.end_time})
+    questions_by_id = {q.id: q for q in quiz.questions}
+
+    detailed_results = [
+        _build_result_detail(result, quiz, users_by_id.get(result.user_id), questions_by_id)
+        for result in results
+        if result.end_time  # Skip incomplete attempts
+    ]
+
+    with _results_cache_lock:
+        _quiz_results_cache[quiz_id] = detailed_results
     return detailed_results
 
 
@@ -523,48 +653,27 @@ async def get_my_quiz_result(quiz_id: str, current_user: User = Depends(get_curr
             detail="Quiz not found"
         )
 
-    # Filter to completed attempts by this user
-    attempts = [r for r in db.get_results_by_quiz(quiz_id) if r.user_id == current_user.id and r.end_time]
+    # Completed attempts by this user, via the per-(quiz, user) index
+    attempts = [r for r in db.get_results_by_quiz_user(quiz_id, current_user.id) if r.end_time]
     if not attempts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No completed attempt found for this user"
         )
 
-    # Pick the latest by end_time
-    latest = sorted(
-        attempts,
-        key=lambda r: r.end_time or "",
-        reverse=True
-    )[0]
-
-    # Build question results
-    question_results = []
-    for answer in latest.answers:
-        question = next((q for q in quiz.questions if q.id == answer["question_id"]), None)
-        if question:
-            question_results.append({
-                "question_id": answer["question_id"],
-                "question_text": question.text,
-                "chosen_index": answer["chosen_index"],
-                "correct_index": question.correct_option_index,
-                "is_correct": answer["chosen_index"] == question.correct_option_index
-            })
-
-    user = db.get_user_by_id(latest.user_id)
-    return ResultDetail(
-        id=latest.id,
-        quiz_id=quiz_id,
-        quiz_title=quiz.title,
-        user_id=latest.user_id,
-        user_name=user.name if user else "Unknown",
-        start_time=latest.start_time,
-        end_time=latest.end_time,
-        score=latest.score,
-        total_questions=len(quiz.questions),
-        correct_answers=sum(1 for qr in question_results if qr["is_correct"]),
-        question_results=question_results
-    )
+    cache_key = (quiz_id, current_user.id)
+    with _results_cache_lock:
+        cached = _result_detail_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Pick the latest by end_time — single pass, no sort of the whole list
+    latest = max(attempts, key=lambda r: r.end_time)
+
+    detail = _build_result_detail(latest, quiz, db.get_user_by_id(latest.user_id))
+    with _results_cache_lock:
+        _result_detail_cache[cache_key] = detail
+    return detail
 
 
 @app.get("/api/results/{attempt_id}", response_model=ResultDetail)
@@ -595,32 +704,19 @@ async def get_result_by_attempt(attempt_id: str, current_user: User = Depends(ge
             detail="Quiz not found"
         )
 
-    question_results = []
-    for answer in result.answers:
-        question = next((q for q in quiz.questions if q.id == answer["question_id"]), None)
-        if question:
-            question_results.append({
-                "question_id": answer["question_id"],
-                "question_text": question.text,
-                "chosen_index": answer["chosen_index"],
-                "correct_index": question.correct_option_index,
-                "is_correct": answer["chosen_index"] == question.correct_option_index
-            })
-
-    user = db.get_user_by_id(result.user_id)
-    return ResultDetail(
-        id=result.id,
-        quiz_id=result.quiz_id,
-        quiz_title=quiz.title,
-        user_id=result.user_id,
-        user_name=user.name if user else "Unknown",
-        start_time=result.start_time,
-        end_time=result.end_time,
-        score=result.score,
-        total_questions=len(quiz.questions),
-        correct_answers=sum(1 for qr in question_results if qr["is_correct"]),
-        question_results=question_results
-    )
+    # Completed attempts never change, so their rendered breakdown is safe
+    # to cache for a long time (authorization was already checked above)
+    if result.end_time:
+        with _results_cache_lock:
+            cached = _result_detail_cache.get(attempt_id)
+        if cached is not None:
+            return cached
+
+    detail = _build_result_detail(result, quiz, db.get_user_by_id(result.user_id))
+    if result.end_time:
+        with _results_cache_lock:
+            _result_detail_cache[attempt_id] = detail
+    return detail
 
 
 @app.get("/")
@@ -16,55 +16,60 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.post("/api/auth/signup")
-async def signup(data: dict):
-    try:
-        # Validate required fields
-        required = ["name", "email", "password", "role"]
-        if not all(field in data for field in required):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Missing required fields"
-            )
-        
-        # Read existing users
-        try:
-            with open("data/users.json", "r") as f:
-                users = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            users = []
+# Append-only user store. The old code re-read and rewrote the whole
+# data/users.json on every signup (O(N) I/O per insert); now each signup is
+# a single O(1) line append to data/users.jsonl, and the duplicate-email
+# check is a dict lookup against an index built once at startup.
+USERS_FILE = "data/users.jsonl"
 
-        # Check if email exists
-        if any(user["email"] == data["email"] for user in users):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+def _load_users():
+    users = {}
+    try:
+        with open(USERS_FILE, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    user = json.loads(line)
+                    users[user["email"]] = user
+    except FileNotFoundError:
+        pass
+    return users
 
-        # Create new user
-        user = {
-            "id": str(uuid.uuid4()),
-            "name": data["name"],
-            "email": data["email"],
-            "password": data["password"],  # In production, hash this!
-            "role": data["role"]
-        }
-        
-        # Add to users list
-        users.append(user)
-        
-        # Write back to file
-        with open("data/users.json", "w") as f:
-            json.dump(users, f, indent=2)
+users_by_email = _load_users()
 
-        return {"message": "User created successfully", "user": user}
+@app.post("/api/auth/signup")
+async def signup(data: dict):
+    # Validate required fields
+    required = ["name", "email", "password", "role"]
+    if not all(field in data for field in required):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing required fields"
+        )
 
-    except Exception as e:
+    # Check if email exists (in-memory index, no file read)
+    if data["email"] in users_by_email:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Signup failed: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
         )
 
+    # Create new user
+    user = {
+        "id": str(uuid.uuid4()),
+        "name": data["name"],
+        "email": data["email"],
+        "password": data["password"],  # In production, hash this!
+        "role": data["role"]
+    }
+
+    # Append one line; existing records are never rewritten
+    with open(USERS_FILE, "a") as f:
+        f.write(json.dumps(user) + "\n")
+    users_by_email[user["email"]] = user
+
+    return {"message": "User created successfully", "user": user}
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -9,10 +9,53 @@ Why Pydantic?
 - Automatic API documentation
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, root_validator, validator
 from typing import List, Optional
+from datetime import datetime, timezone
 from enum import Enum
-import uuid
+import secrets
+
+
+def new_id() -> str:
+    """
+    Generate a random record ID (32 hex chars, 128 bits).
+
+    secrets.token_hex is a single C call (os.urandom + hex encode) and is
+    noticeably cheaper than uuid.uuid4(), which adds Python-level byte
+    twiddling and dash formatting on top of the same 16 random bytes.
+    IDs are opaque strings everywhere in the app, so the format change is
+    invisible to clients; existing UUID-style IDs keep working.
+    """
+    return secrets.token_hex(16)
+
+
+def utc_datetime(value) -> datetime:
+    """
+    Coerce an ISO-8601 string (optionally 'Z'-suffixed) or datetime into an
+    aware UTC datetime.
+
+    Timestamps are parsed exactly once — here, when a record enters the
+    system — instead of on every request that does time arithmetic. The old
+    code re-ran fromisoformat plus Z-suffix munging in start_quiz and
+    submit_quiz for each call.
+    """
+    if isinstance(value, str):
+        # Python 3.11+ fromisoformat is a C parser that accepts the full
+        # ISO-8601 grammar, 'Z' suffix included, so the common case needs no
+        # string rewrite at all. The fallback covers 3.10 and earlier, where
+        # 'Z' must still be spelled as an explicit offset.
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def iso_z(dt: datetime) -> str:
+    """Render an aware-UTC datetime in the API's wire format ('Z' suffix)"""
+    return dt.isoformat().replace('+00:00', 'Z')
 
 
 class UserRole(str, Enum):
@@ -81,7 +124,7 @@ class Question(BaseModel):
     - Supports 2-6 options
     - correct_option_index is 0-based (0 = first option)
     """
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     text: str = Field(..., min_length=5)
     options: List[str] = Field(..., min_items=2, max_items=6)
     correct_option_index: int = Field(..., ge=0)
@@ -165,14 +208,49 @@ class QuizResult(BaseModel):
     """
     Quiz result stored in database
     Tracks complete attempt from start to submission
+
+    Timestamps are held as aware UTC datetimes so request handlers can do
+    arithmetic directly; the ISO-string-with-'Z' wire format only exists at
+    the storage and response boundaries (see utc_datetime / iso_z).
+
+    Answers are stored struct-of-arrays: two parallel lists instead of a
+    list of {"question_id", "chosen_index"} dicts. A dict per answer costs
+    ~200 bytes of overhead plus per-answer key hashing; two flat lists hold
+    the same data at a fraction of the footprint. Position i of both lists
+    describes the same answer.
     """
     id: str  # Same as attempt_id
     quiz_id: str
     user_id: str
-    start_time: str
-    end_time: Optional[str]
-    answers: List[dict]
+    start_time: datetime
+    end_time: Optional[datetime]
+    answer_qids: List[str] = Field(default_factory=list)
+    answer_choices: List[int] = Field(default_factory=list)
     score: float
+    # Persisted at submit time: an attempt is immutable once end_time is
+    # set, so the per-question breakdown is computed exactly once instead of
+    # being re-derived from raw answers on every GET. Rows stored before
+    # these fields existed have an empty breakdown; the read endpoints
+    # rebuild it for those.
+    correct_answers: int = 0
+    question_results: List[dict] = Field(default_factory=list)
+
+    @validator('start_time', 'end_time', pre=True)
+    def parse_timestamps(cls, v):
+        """Accept legacy ISO strings (with or without 'Z') and normalize to aware UTC"""
+        return utc_datetime(v) if v is not None else None
+
+    @root_validator(pre=True)
+    def split_legacy_answers(cls, values):
+        """Accept the old list-of-dicts 'answers' shape and split it"""
+        answers = values.pop('answers', None)
+        if answers:
+            values.setdefault('answer_qids', [a['question_id'] for a in answers])
+            values.setdefault('answer_choices', [a['chosen_index'] for a in answers])
+        return values
+
+    class Config:
+        json_encoders = {datetime: iso_z}
 
 
 class ResultDetail(BaseModel):
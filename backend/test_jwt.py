@@ -0,0 +1,93 @@
+"""
+Tests for the hand-rolled HS256 JWT implementation in auth.py.
+
+The token code replaced python-jose with a direct HMAC implementation, so
+these tests pin down the properties that swap relied on:
+- create/verify round-trip works
+- the output is a standard HS256 JWT (python-jose can decode it)
+- tampered tokens, alg-confusion tokens, and expired tokens are rejected
+"""
+
+import time
+
+import orjson
+import pytest
+
+import auth
+from auth import create_access_token, verify_token, SECRET_KEY, ALGORITHM
+
+
+def _forge(payload: dict, header: dict = None) -> str:
+    """
+    Build a token with arbitrary payload/header but a genuine signature,
+    using the same primitives as create_access_token. Lets tests produce
+    e.g. already-expired or alg-confused tokens.
+    """
+    header_b64 = (
+        auth._b64url(orjson.dumps(header)) if header else auth._JWT_HEADER_B64
+    )
+    signing_input = f"{header_b64}.{auth._b64url(orjson.dumps(payload))}"
+    mac = auth._HMAC_TEMPLATE.copy()
+    mac.update(signing_input.encode())
+    return f"{signing_input}.{auth._b64url(mac.digest())}"
+
+
+def test_round_trip():
+    token = create_access_token({"user_id": "user-1", "role": "student"})
+    payload = verify_token(token)
+    assert payload is not None
+    assert payload["user_id"] == "user-1"
+    assert payload["role"] == "student"
+    assert payload["exp"] > time.time()
+
+
+def test_interop_with_jose():
+    # Tokens must stay standard HS256 JWTs: an independent library decodes
+    # them with the same secret, and our verifier accepts jose-issued ones
+    # (legacy tokens from before the switch keep working)
+    jose_jwt = pytest.importorskip("jose.jwt")
+    token = create_access_token({"user_id": "user-2", "role": "admin"})
+    decoded = jose_jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert decoded["user_id"] == "user-2"
+
+    legacy = jose_jwt.encode(
+        {"user_id": "user-3", "role": "student", "exp": int(time.time()) + 60},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+    payload = verify_token(legacy)
+    assert payload is not None and payload["user_id"] == "user-3"
+
+
+def test_tampered_payload_rejected():
+    token = create_access_token({"user_id": "user-4", "role": "student"})
+    header_b64, payload_b64, signature_b64 = token.split('.')
+    # Re-encode the payload with an escalated role; the signature no longer
+    # matches the signing input
+    payload = orjson.loads(auth._b64url_decode(payload_b64))
+    payload["role"] = "admin"
+    forged = f"{header_b64}.{auth._b64url(orjson.dumps(payload))}.{signature_b64}"
+    assert verify_token(forged) is None
+
+
+def test_alg_none_rejected():
+    claims = {"user_id": "user-5", "role": "admin", "exp": int(time.time()) + 60}
+    # Unsigned alg=none token (empty signature segment)
+    header_b64 = auth._b64url(orjson.dumps({"alg": "none", "typ": "JWT"}))
+    unsigned = f"{header_b64}.{auth._b64url(orjson.dumps(claims))}."
+    assert verify_token(unsigned) is None
+    # Correctly signed but with the header claiming alg=none — the signature
+    # check passes, the algorithm check must still refuse it
+    signed = _forge(claims, header={"alg": "none", "typ": "JWT"})
+    assert verify_token(signed) is None
+
+
+def test_expired_token_rejected():
+    expired = _forge({"user_id": "user-6", "role": "student", "exp": int(time.time()) - 10})
+    assert verify_token(expired) is None
+
+
+def test_garbage_tokens_rejected():
+    assert verify_token("not-a-token") is None
+    assert verify_token("a.b") is None
+    assert verify_token("!!.!!.!!") is None